@@ -8,26 +8,29 @@
 # of the United States Department of Defense or Anduril Industries.
 #
 # =============================================================================
-#  PARSER IMPLEMENTATION: RECURSIVE DESCENT FOR STRUCTURE
+#  PARSER IMPLEMENTATION: LL(1) DESCENT WITH AN EXPLICIT STACK
 # =============================================================================
 #
-# This parser uses a classic recursive-descent strategy for JSON, which is
+# This parser follows the recursive-descent grammar for JSON, which is
 # expression-free and thus well-suited for direct, predictable control flow
 # without an expression parser layer [geeksforgeeks.org, Recursive Descent Parser;
-# cs.rochester.edu, Recursive-Descent Parsing].
+# cs.rochester.edu, Recursive-Descent Parsing]. The recursion is unrolled into
+# a single loop over an explicit container stack.
 #
 # Design Rationale:
 # 1. JSON grammar is LL(1)-friendly: No left recursion or complex precedence
 #    rules, making a hand-coded descent parser both fast and transparent
 #    [online.stanford.edu, Compilers I].
-# 2. Direct function-to-rule mapping keeps the control graph thin and
-#    the branch predictor warm [tutorialspoint.com, Compiler Design Tutorial].
-# 3. LookAhead iterator provides a one-token pushback without the
-#    overhead of a full token buffer.
+# 2. One loop with two states (value / after-value) keeps the control graph
+#    thin and avoids a Python frame per nesting level [tutorialspoint.com,
+#    Compiler Design Tutorial].
+# 3. Tokens are buffered in a list with an EOF sentinel, so one-token
+#    lookahead is an index read rather than an iterator pushback.
 #
-# Lexer uses a single compiled regex to keep branch misses low, based on
-# the principle that scanning in large, predictable strides is more cache-
-# efficient than per-character loops [craftinginterpreters.com, Scanning].
+# Lexer dispatches on the first character of each token to one specialized,
+# anchored regex, so each token costs a table lookup plus a single match
+# rather than a walk through every alternative [craftinginterpreters.com,
+# Scanning].
 #
 # Depth guard defaults to 19 (mirroring JSON_checker), a defensive measure
 # against resource-exhaustion payloads [RFC 8259; hypertextbookshop.com,
@@ -44,10 +47,12 @@
 # =============================================================================
 
 import argparse
+import json
 import os
 import re
 import sys
-from typing import Iterator, List, Tuple
+from array import array
+from typing import Any, Iterator, List, Optional, Tuple, Union
 
 # ---------------------------------------------------------------------------
 # CONSTANTS AND TUNABLES
@@ -58,74 +63,95 @@ STREAM_THRESH_DEFAULT = 262144   # 256 KiB - switch to streaming path once size
 # ---------------------------------------------------------------------------
 # REGEX BLUEPRINT
 # ---------------------------------------------------------------------------
-# Lexer compiled as one regex with named groups. This design minimizes
-# backtracking and allows immediate token classification on match, a known
-# performance win in tight parse loops [craftinginterpreters.com, Scanning].
-_WHITESPACE = r"\s+"
-_NUMBER     = r'-?(?:0|[1-9]\d*)(?:\.\d+)?(?:[eE][+-]?\d+)?'
+# Every JSON token kind starts with a distinct set of characters, so the
+# lexer switches on the first character through a 256-entry table and runs
+# only the one specialized scanner that can match there. No alternation is
+# tried at any position [craftinginterpreters.com, Scanning].
+_WHITESPACE = r"[ \t\n\r]+"
+_NUMBER     = r'-?(?:0|[1-9]\d*)(?P<FLOAT>\.\d+(?:[eE][+-]?\d+)?|[eE][+-]?\d+)?'   # FLOAT set only for a fraction/exponent
 _ESCAPE     = r'\\.'
 _STRING     = r'"(?:[^"\\\x00-\x1F]|' + _ESCAPE + r')*"'
 _LITERAL    = r"true|false|null"
 
-_TOKEN_RE = re.compile(
-    rf"(?P<STRING>{_STRING})|"
-    rf"(?P<NUMBER>{_NUMBER})|"
-    rf"(?P<LITERAL>{_LITERAL})|"
-    r"(?P<BRACE>[{}])|"          # { or }
-    r"(?P<BRACKET>[\[\]])|"      # [ or ]
-    r"(?P<COMMA>,)|"
-    r"(?P<COLON>:)|"
-    rf"(?P<WHITESPACE>{_WHITESPACE})",
-)
+_STRING_MATCH     = re.compile(_STRING).match
+_NUMBER_MATCH     = re.compile(_NUMBER, re.ASCII).match
+_LITERAL_MATCH    = re.compile(_LITERAL).match
+_WHITESPACE_MATCH = re.compile(_WHITESPACE).match
+
+# Token kind codes stored in the kinds array. Scalar kinds come first so
+# "carries a finished value" is a single comparison (kind <= _K_LITERAL).
+_K_STRING, _K_NUMBER, _K_LITERAL = 0, 1, 2
+_K_LBRACE, _K_RBRACE, _K_LBRACKET, _K_RBRACKET = 3, 4, 5, 6
+_K_COMMA, _K_COLON, _K_EOF = 7, 8, 9
+
+# Public kind names by code, as reported by lex() and in error messages.
+_KIND_NAMES = ("STRING", "NUMBER", "LITERAL", "BRACE", "BRACE",
+               "BRACKET", "BRACKET", "COMMA", "COLON", "EOF")
+
+# How each token the parser can demand is described in mismatch errors.
+_EXPECTED_DESC = {_K_STRING: "STRING", _K_COMMA: "COMMA ','", _K_COLON: "COLON ':'"}
+
+_DISPATCH: List = [None] * 256     # first character -> (kind code, scanner or None)
+_DISPATCH[ord("{")] = (_K_LBRACE, None)
+_DISPATCH[ord("}")] = (_K_RBRACE, None)
+_DISPATCH[ord("[")] = (_K_LBRACKET, None)
+_DISPATCH[ord("]")] = (_K_RBRACKET, None)
+_DISPATCH[ord(",")] = (_K_COMMA, None)
+_DISPATCH[ord(":")] = (_K_COLON, None)
+_DISPATCH[ord('"')] = (_K_STRING, _STRING_MATCH)
+for _ch in "-0123456789":
+    _DISPATCH[ord(_ch)] = (_K_NUMBER, _NUMBER_MATCH)
+for _ch in "tfn":
+    _DISPATCH[ord(_ch)] = (_K_LITERAL, _LITERAL_MATCH)
+del _ch
+
+# Native values for the three JSON literals, shared by every LITERAL token.
+_LITERAL_MAP = {"true": True, "false": False, "null": None}
+
+# Translation table that deletes hex digits. A \uXXXX payload is valid exactly
+# when nothing survives the translate, so the check runs in one C call.
+_HEX_TBL = str.maketrans("", "", "0123456789abcdefABCDEF")
+
+# Any surrogate code point appearing literally in a string is unpaired.
+_SURR_RE = re.compile("[\ud800-\udfff]")
+
+# Single-character escapes and their decoded values (RFC 8259 section 7).
+_SIMPLE_ESCAPES = {
+    '"': '"', "\\": "\\", "/": "/",
+    "b": "\b", "f": "\f", "n": "\n", "r": "\r", "t": "\t",
+}
 
 # ---------------------------------------------------------------------------
 # TOKEN RECORD
 # ---------------------------------------------------------------------------
-class Token(Tuple[str, str, int]):
-    """
-    Immutable token record: (kind, value, absolute_offset).
-
-    Rationale: Using a lightweight tuple here keeps allocations low.
-    Offsets are retained for precise SyntaxError reporting [tutorialspoint.com,
-    Compiler Design Tutorial; geeksforgeeks.org, Error Detection and Recovery].
-    """
-    pass
+# Tokens are stored struct-of-arrays: kind codes in an array('b'), absolute
+# offsets in an array('q') and native values in a parallel list. The parser
+# reads the three columns by index, so no per-token tuple is ever allocated.
+# Offsets are retained for precise SyntaxError reporting [tutorialspoint.com,
+# Compiler Design Tutorial; geeksforgeeks.org, Error Detection and Recovery].
+# lex() still yields (kind, value, absolute_offset) tuples for callers.
+Token = Tuple[str, Any, int]
 
 # ---------------------------------------------------------------------------
-# LOOKAHEAD RING
+# STRING VALIDATION
 # ---------------------------------------------------------------------------
-class LookAhead:
+def _read_hex4(inner: str, i: int, token_start: int) -> int:
     """
-    One-slot pushback iterator.
-
-    This implements minimal lookahead required for LL(1) parsing without
-    incurring full buffering cost. Matches the "single token of lookahead"
-    principle in top-down parsing theory [geeksforgeeks.org, Top Down Parsing].
+    Decode the four hex digits of the \\uXXXX escape starting at inner[i].
     """
-    def __init__(self, iterable: Iterator[Token]):
-        self._iter = iter(iterable)
-        self._buf: List[Token] = []
+    if i + 6 > len(inner):
+        raise SyntaxError(f"short unicode escape at offset {token_start + 1 + i}")
+    hexpart = inner[i + 2:i + 6]
+    if hexpart.translate(_HEX_TBL):
+        raise SyntaxError(f"invalid hex escape {inner[i:i + 6]} at offset {token_start + 1 + i}")
+    return int(hexpart, 16)
 
-    def __iter__(self):
-        return self
-
-    def __next__(self):
-        if self._buf:
-            return self._buf.pop()
-        return next(self._iter)
-
-    def peek(self) -> Token:
-        if not self._buf:
-            self._buf.append(next(self._iter))
-        return self._buf[-1]
-
-# ---------------------------------------------------------------------------
-# STRING VALIDATION
-# ---------------------------------------------------------------------------
 def _validate_string(raw: str, token_start: int) -> str:
     """
-    Unescape JSON string and reject invalid escapes.
+    Unescape JSON string and reject invalid escapes in a single pass.
 
+    Escape-free runs are located with str.find and copied as slices; each
+    escape is validated and decoded in place, so the input is read once.
     Handles three classes of errors with precise offsets:
     1) Structural issues - unterminated string or trailing backslash before a missing quote.
     2) Escape syntax - invalid single escape, short unicode escape, invalid hex digits.
@@ -140,202 +166,341 @@ def _validate_string(raw: str, token_start: int) -> str:
         raise SyntaxError(f"unterminated string starting at offset {token_start}")
 
     inner = raw[1:-1]
+    # Fast path: plain ASCII without escapes is already its own decoded value.
+    # isascii() is a flag check on CPython strings, so this costs one find.
+    if inner.isascii() and "\\" not in inner:
+        return inner
+    # Raw surrogates can only arrive through str input and are never ASCII;
+    # escaped ones are checked below on the decoded code point.
+    if not inner.isascii() and _SURR_RE.search(inner):
+        raise SyntaxError("unpaired surrogate in string")
+    j = inner.find("\\")
+    if j < 0:
+        return inner
+
+    out: List[str] = []
     i = 0
     n = len(inner)
-    while i < n:
-        ch = inner[i]
-        if ch == "\\":
-            if i + 1 >= n:
-                raise SyntaxError(f"trailing backslash in string at offset {token_start + 1 + i}")
-            esc = inner[i + 1]
-            if esc == "u":
-                if i + 6 > n:
-                    raise SyntaxError(f"short unicode escape at offset {token_start + 1 + i}")
-                hexpart = inner[i + 2:i + 6]
-                if not all(c in '0123456789abcdefABCDEF' for c in hexpart):
-                    seq = inner[i:i + 6]
-                    raise SyntaxError(f"invalid hex escape {seq} at offset {token_start + 1 + i}")
-                i += 6
-                continue
-            elif esc in "\"\\/bfnrt":
-                i += 2
-                continue
-            else:
-                raise SyntaxError(f"invalid escape \{esc} at offset {token_start + 1 + i}")
-        i += 1
-    try:
-        decoded = inner.encode("utf-8").decode("unicode_escape")
-    except UnicodeDecodeError as exc:
-        raise SyntaxError(f"bad escape sequence: {exc}") from None
-    for ch in decoded:
-        code = ord(ch)
-        if 0xD800 <= code <= 0xDFFF:
-            raise SyntaxError("unpaired surrogate in string")
-    return decoded
-
-def lex(text: str) -> Iterator[Token]:
+    while j >= 0:
+        if j > i:
+            out.append(inner[i:j])
+        if j + 1 >= n:
+            raise SyntaxError(f"trailing backslash in string at offset {token_start + 1 + j}")
+        esc = inner[j + 1]
+        if esc == "u":
+            code = _read_hex4(inner, j, token_start)
+            i = j + 6
+            if 0xD800 <= code <= 0xDBFF and inner.startswith("\\u", i):
+                low = _read_hex4(inner, i, token_start)
+                if 0xDC00 <= low <= 0xDFFF:
+                    code = 0x10000 + ((code - 0xD800) << 10) + (low - 0xDC00)
+                    i += 6
+            if 0xD800 <= code <= 0xDFFF:
+                raise SyntaxError(f"unpaired surrogate in string at offset {token_start + 1 + j}")
+            out.append(chr(code))
+        else:
+            ch = _SIMPLE_ESCAPES.get(esc)
+            if ch is None:
+                raise SyntaxError(f"invalid escape \\{esc} at offset {token_start + 1 + j}")
+            out.append(ch)
+            i = j + 2
+        j = inner.find("\\", i)
+    out.append(inner[i:])
+    return "".join(out)
+
+def _tokenize(text: str) -> Tuple[array, List[Any], array]:
     """
-    Single-pass generator producing tokens. Rejects any gap in regex coverage.
-
-    Early conversion to Python native types moves type interpretation out
-    of the parse loop, improving throughput [craftinginterpreters.com, Scanning].
+    Single-pass tokenizer returning (kinds, values, offsets) columns. Rejects
+    any character no scanner accepts.
+
+    Each token is classified by its first character through _DISPATCH.
+    Structural characters are emitted directly and value spans run their own
+    anchored scanner. Whitespace is skipped before dispatch. Filling the
+    columns in place avoids a generator suspend/resume per token. Early
+    conversion to Python native types moves type interpretation out of the
+    parse loop, improving throughput [craftinginterpreters.com, Scanning].
     """
+    kinds = array("b")
+    values: List[Any] = []
+    offsets = array("q")
+    add_kind = kinds.append
+    add_value = values.append
+    add_offset = offsets.append
+    # Module globals are bound to locals once; the loop below runs per token.
+    dispatch = _DISPATCH
+    validate = _validate_string
+    skip_ws = _WHITESPACE_MATCH
     pos = 0
-    for m in _TOKEN_RE.finditer(text):
-        kind  = m.lastgroup
-        value = m.group()
-        start = m.start()
+    n = len(text)
+    while pos < n:
+        ch = text[pos]
+        if ch in " \t\n\r":
+            # Whitespace runs are skipped in one C call and never become tokens.
+            pos = skip_ws(text, pos).end()
+            if pos == n:
+                break
+            ch = text[pos]
+        byte = ord(ch)
+        entry = dispatch[byte] if byte < 256 else None
+        if entry is None:
+            raise SyntaxError(f"invalid character at offset {pos}")
+        kind, scan = entry
+        if scan is None:
+            add_kind(kind)
+            add_value(ch)
+            add_offset(pos)
+            pos += 1
+            continue
 
-        if start != pos:
-            raise SyntaxError(f"invalid character at offset {pos}")  # Gap in match coverage
+        m = scan(text, pos)
+        if m is None:
+            raise SyntaxError(f"invalid character at offset {pos}")
+        value = m.group()
+        start = pos
         pos = m.end()
 
-        if kind == "WHITESPACE":
-            continue
-        if kind == "STRING":
-            value = _validate_string(value, start)
-        elif kind == "NUMBER":
-            value = float(value) if any(c in value for c in ".eE") else int(value)
-        elif kind == "LITERAL":
-            value = {"true": True, "false": False, "null": None}[value]
-
-        yield Token((kind, value, start))
+        if kind == _K_STRING:
+            value = validate(value, start)
+        elif kind == _K_NUMBER:
+            value = float(value) if m.lastgroup == "FLOAT" else int(value)
+        else:
+            value = _LITERAL_MAP[value]
 
-    if pos != len(text):
-        raise SyntaxError(f"invalid character at offset {pos}")
+        add_kind(kind)
+        add_value(value)
+        add_offset(start)
+    return kinds, values, offsets
 
-# ---------------------------------------------------------------------------
-# PARSER UTILITY
-# ---------------------------------------------------------------------------
-def _expect(tokens: LookAhead, expected_kind: str, expected_value=None):
+def lex(text: str) -> Iterator[Token]:
     """
-    Consume and verify the next token. Raises a precise error with expected and actual.
+    Generator of (kind, value, offset) tuples, kept for the step 1-4 API and
+    --debug. Tuples are built here on demand; parse reads the columns directly.
     """
-    try:
-        kind, value, pos = next(tokens)
-    except StopIteration:
-        raise SyntaxError("unexpected end of input")
-    if kind != expected_kind or (expected_value is not None and value != expected_value):
-        exp = expected_kind if expected_value is None else f"{expected_kind} '{expected_value}'"
-        act_val = value if isinstance(value, (str, int, float, type(None), bool)) else str(value)
-        raise SyntaxError(f"unexpected token {kind} '{act_val}' at offset {pos} - expected {exp}")
-    return value
+    kinds, values, offsets = _tokenize(text)
+    names = _KIND_NAMES
+    for kind, value, pos in zip(kinds, values, offsets):
+        yield (names[kind], value, pos)
 
 # ---------------------------------------------------------------------------
-# CORE VALUE PARSER
+# PARSER UTILITY
 # ---------------------------------------------------------------------------
-def _parse_value(tokens: LookAhead, depth: int, max_depth: int, allow_dup: bool):
+def _unexpected(kinds: array, values: List[Any], offsets: array, i: int, expected_kind: int) -> SyntaxError:
     """
-    Dispatch based on token type. Enforces depth limit as a hard stop against
-    stack abuse [hypertextbookshop.com, Parser Error Handling and Recovery].
+    Build the precise error for a mismatched token at index i. Only reached
+    once the inline kind check in the parse loop has already failed.
     """
-    if depth > max_depth:
-        raise SyntaxError("depth limit exceeded")
-    try:
-        kind, value, _ = next(tokens)
-    except StopIteration:
-        raise SyntaxError("unexpected end of input")
-
-    if kind in {"STRING", "NUMBER", "LITERAL"}:
-        return value
-    if kind == "BRACE" and value == "{":
-        return _parse_object(tokens, depth + 1, max_depth, allow_dup)
-    if kind == "BRACKET" and value == "[":
-        return _parse_array(tokens, depth + 1, max_depth, allow_dup)
-
-    raise SyntaxError(f"unexpected token {kind} '{value}' - value expected")
+    kind = kinds[i]
+    if kind == _K_EOF:
+        return SyntaxError("unexpected end of input")
+    return SyntaxError(f"unexpected token {_KIND_NAMES[kind]} '{values[i]}' at offset {offsets[i]}"
+                       f" - expected {_EXPECTED_DESC[expected_kind]}")
 
 # ---------------------------------------------------------------------------
-# ARRAY PARSER
+# CORE PARSER
 # ---------------------------------------------------------------------------
-def _parse_array(tokens: LookAhead, depth: int, max_depth: int, allow_dup: bool):
+def _parse_tokens(kinds: array, values: List[Any], offsets: array, max_depth: int, allow_dup: bool):
     """
-    Parse a JSON array.
-
-    The loop is tight and straightforward, but in Python the primary speed wins
-    come from lexer efficiency and minimizing per-token work rather than function
-    call overhead. The design keeps per-element operations minimal while relying on
-    the lexer to do the heavy lifting [online.stanford.edu, Compilers I].
+    Parse one value from the token columns and return (value, next_index).
+
+    Iterative state machine over an explicit stack of open containers, so
+    nesting costs a list push instead of a Python frame. Two states alternate:
+    value position (dispatch on the token, open containers) and after-value
+    position (attach to the parent, then expect a comma or a closer). The depth
+    limit is a hard stop against stack abuse [hypertextbookshop.com, Parser
+    Error Handling and Recovery]; duplicate key rejection catches policy
+    violations early [geeksforgeeks.org, Error Detection].
     """
-    items: List = []
-    try:
-        pk = tokens.peek()
-    except StopIteration:
-        raise SyntaxError("unexpected end of input")
-    if pk[0] == "BRACKET" and pk[1] == "]":
-        next(tokens)
-        return items
-
+    stack: List = []   # open containers, innermost last
+    keys: List = []    # pending key for each open container (None for arrays)
+    i = 0
     while True:
-        items.append(_parse_value(tokens, depth, max_depth, allow_dup))
-        try:
-            pk = tokens.peek()
-        except StopIteration:
+        # Value position.
+        if len(stack) > max_depth:
+            raise SyntaxError("depth limit exceeded")
+        kind = kinds[i]
+        i += 1
+        if kind <= _K_LITERAL:
+            value = values[i - 1]
+        elif kind == _K_LBRACE:
+            if kinds[i] == _K_RBRACE:
+                i += 1
+                value = {}
+            else:
+                if kinds[i] != _K_STRING:
+                    raise _unexpected(kinds, values, offsets, i, _K_STRING)
+                if kinds[i + 1] != _K_COLON:
+                    raise _unexpected(kinds, values, offsets, i + 1, _K_COLON)
+                stack.append({})
+                keys.append(values[i])   # first key of a fresh object cannot be a duplicate
+                i += 2
+                continue
+        elif kind == _K_LBRACKET:
+            if kinds[i] == _K_RBRACKET:
+                i += 1
+                value = []
+            else:
+                stack.append([])
+                keys.append(None)
+                continue
+        elif kind == _K_EOF:
             raise SyntaxError("unexpected end of input")
-        if pk[0] == "BRACKET" and pk[1] == "]":
-            next(tokens)
+        else:
+            raise SyntaxError(f"unexpected token {_KIND_NAMES[kind]} '{values[i - 1]}' - value expected")
+
+        # After-value position: attach, then close containers until a comma.
+        while stack:
+            top = stack[-1]
+            key = keys[-1]
+            if key is None:
+                top.append(value)
+            else:
+                top[key] = value
+            kind = kinds[i]
+            i += 1
+            if key is None and kind == _K_RBRACKET:
+                value = stack.pop()
+                keys.pop()
+                continue
+            if key is not None and kind == _K_RBRACE:
+                value = stack.pop()
+                keys.pop()
+                continue
+            if kind != _K_COMMA:
+                raise _unexpected(kinds, values, offsets, i - 1, _K_COMMA)
+            if key is not None:
+                if kinds[i] != _K_STRING:
+                    raise _unexpected(kinds, values, offsets, i, _K_STRING)
+                if kinds[i + 1] != _K_COLON:
+                    raise _unexpected(kinds, values, offsets, i + 1, _K_COLON)
+                key = values[i]
+                # Checked when the key is read, before its value is parsed.
+                if not allow_dup and key in top:
+                    raise SyntaxError("duplicate key")
+                keys[-1] = key
+                i += 2
             break
-        _expect(tokens, "COMMA", ",")
-    return items
+        else:
+            return value, i
 
 # ---------------------------------------------------------------------------
-# OBJECT PARSER
+# C FAST PATH
 # ---------------------------------------------------------------------------
-def _parse_object(tokens: LookAhead, depth: int, max_depth: int, allow_dup: bool):
+class _FastPathMiss(Exception):
     """
-    Parses a JSON object. Enforces duplicate key policy at parse time.
-
-    Duplicate key rejection here is a design choice: catching policy violations
-    early prevents downstream semantic errors [geeksforgeeks.org, Error Detection].
+    Raised inside stdlib decoder hooks to abandon the fast path.
     """
-    obj = {}
-    try:
-        pk = tokens.peek()
-    except StopIteration:
-        raise SyntaxError("unexpected end of input")
-    if pk[0] == "BRACE" and pk[1] == "}":
-        next(tokens)
-        return obj
 
-    while True:
-        key = _expect(tokens, "STRING")
-        _expect(tokens, "COLON", ":")
-        if not allow_dup and key in obj:
-            raise SyntaxError("duplicate key")
-        obj[key] = _parse_value(tokens, depth, max_depth, allow_dup)
-        try:
-            pk = tokens.peek()
-        except StopIteration:
-            raise SyntaxError("unexpected end of input")
-        if pk[0] == "BRACE" and pk[1] == "}":
-            next(tokens)
-            break
-        _expect(tokens, "COMMA", ",")
+def _reject_constant(name: str):
+    raise _FastPathMiss(name)   # NaN / Infinity are not JSON
+
+def _pairs_unique(pairs: List[Tuple[str, Any]]) -> dict:
+    obj = dict(pairs)
+    if len(obj) != len(pairs):
+        raise _FastPathMiss("duplicate key")
     return obj
 
+def _parse_fast(text: str, max_depth: int):
+    """
+    Decode with the stdlib C scanner, then re-check what it does not enforce.
+
+    json.loads already rejects everything this grammar rejects except NaN /
+    Infinity, duplicate keys, scalar roots, nesting depth and lone surrogates.
+    The first two are refused through decoder hooks; the rest are verified by
+    one iterative walk over the decoded containers. Duplicates miss even when
+    allowed, because the values they overwrite never reach the walk. Returns
+    None on any miss so the caller can rerun the reference parser, which
+    applies the duplicate policy and reports the precise error.
+    """
+    if max_depth < 0:
+        return None   # even the root container is past the limit
+    try:
+        result = json.loads(
+            text,
+            parse_constant=_reject_constant,
+            object_pairs_hook=_pairs_unique,
+        )
+    except (ValueError, RecursionError, _FastPathMiss):
+        return None
+    if type(result) is not dict and type(result) is not list:
+        return None
+
+    surr = _SURR_RE.search
+    stack = [(result, 0)]
+    while stack:
+        node, depth = stack.pop()
+        if type(node) is dict:
+            for key in node:
+                if not key.isascii() and surr(key):
+                    return None
+            children = node.values()
+        else:
+            children = node
+        if node and depth >= max_depth:
+            return None   # children would sit past the depth limit
+        for child in children:
+            kind = type(child)
+            if kind is list or kind is dict:
+                stack.append((child, depth + 1))
+            elif kind is str and not child.isascii() and surr(child):
+                return None
+    return result
+
 # ---------------------------------------------------------------------------
 # PUBLIC API
 # ---------------------------------------------------------------------------
-def parse(text: str, *, max_depth: int = DEPTH_LIMIT_DEFAULT, allow_dup: bool = False):
+def parse(text: Union[str, bytes], *, max_depth: int = DEPTH_LIMIT_DEFAULT, allow_dup: bool = False,
+          fast: Optional[bool] = None):
     """
     Parses JSON text into Python structures.
 
     Entry point enforces RFC 8259's root constraint that payload must be
     an object or array. Rejects trailing tokens to maintain full input
     consumption [RFC 8259; craftinginterpreters.com, Parsing Expressions].
+    Binary input is routed through parse_bytes. On the fast path, valid input
+    is decoded by the stdlib C scanner under the same policies; anything it
+    cannot accept falls through to this parser, which reports the error.
+    fast=None (default) takes the fast path for the strict default profile -
+    duplicates rejected, default depth limit - where it is always exact and
+    fallback is rare; True / False force it on or off.
     """
-    tokens = LookAhead(lex(text))
-    first_kind, _, _ = tokens.peek()
-    if first_kind not in ("BRACE", "BRACKET"):
-        _, first_val, first_pos = tokens.peek()
-        raise SyntaxError(f"payload must be object or array at root - got {first_kind} '{first_val}' at offset {first_pos}")
+    if not isinstance(text, str):
+        return parse_bytes(text, max_depth=max_depth, allow_dup=allow_dup, fast=fast)
+    if fast is None:
+        fast = not allow_dup and max_depth == DEPTH_LIMIT_DEFAULT
+    if fast:
+        result = _parse_fast(text, max_depth)
+        if result is not None:
+            return result
+    kinds, values, offsets = _tokenize(text)
+    kinds.append(_K_EOF)
+    values.append("")
+    offsets.append(len(text))
+    first_kind = kinds[0]
+    if first_kind == _K_EOF:
+        raise SyntaxError("unexpected end of input")
+    if not _K_LBRACE <= first_kind <= _K_RBRACKET:
+        raise SyntaxError(f"payload must be object or array at root - got {_KIND_NAMES[first_kind]} "
+                          f"'{values[0]}' at offset {offsets[0]}")
 
-    result = _parse_value(tokens, 0, max_depth, allow_dup)
-    try:
-        k2, v2, p2 = next(tokens)
-    except StopIteration:
+    result, i = _parse_tokens(kinds, values, offsets, max_depth, allow_dup)
+    if kinds[i] == _K_EOF:
         return result
-    raise SyntaxError(f"extra data after root value at offset {p2}")
+    raise SyntaxError(f"extra data after root value at offset {offsets[i]}")
+
+def parse_bytes(data: Union[bytes, bytearray, memoryview], *, max_depth: int = DEPTH_LIMIT_DEFAULT,
+                allow_dup: bool = False, fast: Optional[bool] = None):
+    """
+    Parses UTF-8 encoded JSON from any bytes-like buffer.
+
+    RFC 8259 requires UTF-8 for exchanged JSON, so the buffer is decoded
+    exactly once, strictly, and never re-encoded afterwards. Malformed UTF-8
+    is reported as a SyntaxError carrying the byte offset.
+    """
+    try:
+        text = str(data, "utf-8")
+    except UnicodeDecodeError as exc:
+        raise SyntaxError(f"invalid UTF-8 at byte offset {exc.start}") from None
+    return parse(text, max_depth=max_depth, allow_dup=allow_dup, fast=fast)
 
 # ---------------------------------------------------------------------------
 # CLI ENTRYPOINT
@@ -352,6 +517,8 @@ def _cli(argv: List[str]):
     ap.add_argument("--debug", action="store_true", help="dump token stream and exit")
     ap.add_argument("--max-depth", type=int, default=DEPTH_LIMIT_DEFAULT)
     ap.add_argument("--allow-dup-keys", action="store_true")
+    ap.add_argument("--fast", action=argparse.BooleanOptionalAction, default=None,
+                    help="force the stdlib C scanner on or off (default: on for strict default options)")
     ap.add_argument("--streaming-threshold", type=int, default=STREAM_THRESH_DEFAULT)
     args = ap.parse_args(argv)
 
@@ -359,15 +526,16 @@ def _cli(argv: List[str]):
     read_mode = "stream" if fsize > args.streaming_threshold else "buffer"
     # Streaming roadmap - true stream parsing will require adapting the lexer to operate
     # on chunks from an input stream while preserving token boundaries and offsets.
-    data = open(args.file, "r", encoding="utf-8").read()
+    with open(args.file, "rb") as fh:
+        data = fh.read()
 
     if args.debug:
-        for tok in lex(data):
+        for tok in lex(data.decode("utf-8")):
             print(tok)
         return 0
 
     try:
-        parse(data, max_depth=args.max_depth, allow_dup=args.allow_dup_keys)
+        parse_bytes(data, max_depth=args.max_depth, allow_dup=args.allow_dup_keys, fast=args.fast)
         print("OK" if read_mode == "buffer" else "OK (stream mode placeholder)")
         return 0
     except SyntaxError as exc:
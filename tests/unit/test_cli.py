@@ -17,3 +17,14 @@ def test_cli_streaming_placeholder_prints_ok(monkeypatch):
         assert "OK (stream mode placeholder)" in (cp.stdout + cp.stderr)
     finally:
         pathlib.Path(fname).unlink(missing_ok=True)
+
+def test_cli_no_fast_uses_reference_parser():
+    with tempfile.NamedTemporaryFile("w", delete=False) as f:
+        f.write('{"a": 1, "a": 2}')
+        fname = f.name
+    try:
+        cp = subprocess.run([sys.executable, "json_parser.py", fname, "--no-fast"], capture_output=True, text=True)
+        assert cp.returncode == 1
+        assert "duplicate key" in cp.stderr
+    finally:
+        pathlib.Path(fname).unlink(missing_ok=True)
@@ -0,0 +1,64 @@
+import glob
+import os
+import pytest
+import json_parser as jp
+
+TESTS_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+CONFORMANCE_VALID = sorted(
+    glob.glob(os.path.join(TESTS_DIR, "step*", "pass*.json"))
+    + glob.glob(os.path.join(TESTS_DIR, "step*", "valid*.json"))
+)
+if not CONFORMANCE_VALID:
+    raise RuntimeError("No pass*.json / valid*.json conformance files found under tests/step*")
+
+def test_fast_path_matches_reference_on_valid_input():
+    txt = '{"a": [1, 2.5, true, null, "caf\\u00e9"], "b": {"c": "\\ud83d\\ude00"}}'
+    assert jp.parse(txt, fast=True) == jp.parse(txt, fast=False)
+
+@pytest.mark.parametrize("bad, msg", [
+    ('{"a":1,"a":2}', "duplicate key"),
+    ('[NaN]', "invalid character"),
+    ('true', "payload must be object or array at root"),
+    ('["\\ud800"]', "unpaired surrogate"),
+    ('[1,]', "value expected"),
+])
+def test_fast_path_falls_back_for_precise_errors(bad, msg):
+    with pytest.raises(SyntaxError) as ei:
+        jp.parse(bad, fast=True)
+    assert msg in str(ei.value)
+
+def test_fast_path_enforces_depth_limit():
+    ok = "[" * 20 + "]" * 20
+    assert jp.parse(ok, fast=True) == jp.parse(ok, fast=False)
+    with pytest.raises(SyntaxError) as ei:
+        jp.parse("[" * 20 + "1" + "]" * 20, fast=True)
+    assert "depth limit exceeded" in str(ei.value)
+
+def test_fast_path_allows_duplicates_when_requested():
+    assert jp.parse('{"a":1,"a":2}', allow_dup=True, fast=True) == {"a": 2}
+
+@pytest.mark.parametrize("txt", ["[]", "{}"])
+def test_fast_path_negative_depth_rejects_empty_root(txt):
+    with pytest.raises(SyntaxError) as ei:
+        jp.parse(txt, max_depth=-1, fast=True)
+    assert "depth limit exceeded" in str(ei.value)
+
+@pytest.mark.parametrize("kw, used", [
+    ({}, True),
+    ({"allow_dup": True}, False),
+    ({"max_depth": 5}, False),
+    ({"fast": False}, False),
+    ({"allow_dup": True, "fast": True}, True),
+])
+def test_fast_path_selected_by_default_profile(monkeypatch, kw, used):
+    calls = []
+    real = jp._parse_fast
+    monkeypatch.setattr(jp, "_parse_fast", lambda *a: calls.append(a) or real(*a))
+    assert jp.parse('{"a": [1]}', **kw) == {"a": [1]}
+    assert bool(calls) is used
+
+@pytest.mark.parametrize("path", CONFORMANCE_VALID, ids=lambda p: os.path.relpath(p, TESTS_DIR))
+def test_reference_parser_matches_fast_path_on_conformance_files(path):
+    with open(path, "rb") as fh:
+        data = fh.read()
+    assert jp.parse_bytes(data, fast=False) == jp.parse_bytes(data, fast=True)
@@ -0,0 +1,36 @@
+import pytest
+import json_parser as jp
+
+def test_invalid_character_reported_at_its_offset():
+    with pytest.raises(SyntaxError) as ei:
+        list(jp.lex('[1, @, 2]'))
+    assert "invalid character at offset 4" in str(ei.value)
+
+def test_scanner_does_not_skip_ahead_past_bad_literal():
+    # An anchored scanner must fail at the bad literal, not resync on "true" later.
+    with pytest.raises(SyntaxError) as ei:
+        list(jp.lex('[tru, true]'))
+    assert "invalid character at offset 1" in str(ei.value)
+
+def test_non_json_whitespace_rejected():
+    with pytest.raises(SyntaxError):
+        jp.parse('[1,\f2]')
+
+def test_non_ascii_digits_rejected():
+    with pytest.raises(SyntaxError):
+        jp.parse('[1١]')
+
+def test_token_stream_kinds_and_offsets():
+    toks = [(k, v, p) for k, v, p in jp.lex('{"a": [1, 2.5, true]}')]
+    assert toks == [
+        ("BRACE", "{", 0), ("STRING", "a", 1), ("COLON", ":", 4),
+        ("BRACKET", "[", 6), ("NUMBER", 1, 7), ("COMMA", ",", 8),
+        ("NUMBER", 2.5, 10), ("COMMA", ",", 13), ("LITERAL", True, 15),
+        ("BRACKET", "]", 19), ("BRACE", "}", 20),
+    ]
+
+@pytest.mark.parametrize("fast", [False, True])
+def test_number_kind_selected_by_fraction_or_exponent(fast):
+    vals = jp.parse('[0, -12, 1.5, 2e3, -4.0E-1]', fast=fast)
+    assert [type(v) for v in vals] == [int, int, float, float, float]
+    assert vals == [0, -12, 1.5, 2000.0, -0.4]
@@ -38,3 +38,32 @@ def test_trailing_backslash_direct_call():
     with pytest.raises(SyntaxError) as ei:
         jp._validate_string('"\\', 0)  # trailing backslash before closing quote
     assert "trailing backslash in string" in str(ei.value)
+
+@pytest.mark.parametrize("fast", [False, True])
+def test_escapes_decoded_in_single_pass(fast):
+    assert jp.parse('["a\\nb\\t\\"\\\\\\/\\u00e9"]', fast=fast) == ['a\nb\t"\\/é']
+
+@pytest.mark.parametrize("fast", [False, True])
+def test_surrogate_pair_decodes_to_supplementary_code_point(fast):
+    assert jp.parse('["\\ud83d\\ude00"]', fast=fast) == ["\U0001F600"]
+
+@pytest.mark.parametrize("fast", [False, True])
+def test_non_ascii_text_preserved(fast):
+    assert jp.parse('["café \\n"]', fast=fast) == ["café \n"]
+
+@pytest.mark.parametrize("fast", [False, True])
+def test_parse_bytes_decodes_utf8_once(fast):
+    payload = '{"k": "café"}'.encode("utf-8")
+    assert jp.parse_bytes(payload, fast=fast) == {"k": "café"}
+    assert jp.parse_bytes(memoryview(payload), fast=fast) == {"k": "café"}
+    assert jp.parse(payload, fast=fast) == {"k": "café"}
+
+def test_parse_bytes_rejects_invalid_utf8():
+    with pytest.raises(SyntaxError) as ei:
+        jp.parse_bytes(b'["\xff"]')
+    assert "invalid UTF-8 at byte offset 2" in str(ei.value)
+
+def test_raw_surrogate_in_str_input_rejected():
+    with pytest.raises(SyntaxError) as ei:
+        jp.parse('["a\ud800\\n"]')
+    assert "unpaired surrogate" in str(ei.value)
@@ -30,3 +30,41 @@ def test_missing_closing_bracket_in_array():
     with pytest.raises(SyntaxError) as ei:
         jp.parse('[1,2')
     assert "unexpected end of input" in str(ei.value) or "expected BRACKET" in str(ei.value)
+
+@pytest.mark.parametrize("txt", ["", "  "])
+def test_empty_input_reports_end_of_input(txt):
+    with pytest.raises(SyntaxError) as ei:
+        jp.parse(txt)
+    assert "unexpected end of input" in str(ei.value)
+
+@pytest.mark.parametrize("txt, kw", [
+    ('{"a":1,"a":}', {}),
+    ('{"a":1,"a":[[[[1]]]]}', {"max_depth": 2}),
+])
+def test_duplicate_key_reported_before_its_value_is_parsed(txt, kw):
+    with pytest.raises(SyntaxError) as ei:
+        jp.parse(txt, fast=False, **kw)
+    assert str(ei.value) == "duplicate key"
+
+def test_depth_limit_boundary_at_default():
+    assert jp.parse("[" * 19 + "1" + "]" * 19, fast=False)
+    with pytest.raises(SyntaxError) as ei:
+        jp.parse("[" * 20 + "1" + "]" * 20, fast=False)
+    assert "depth limit exceeded" in str(ei.value)
+
+def test_duplicate_key_rejected_in_nested_object():
+    with pytest.raises(SyntaxError) as ei:
+        jp.parse('{"x":{"a":1,"a":2}}', fast=False)
+    assert "duplicate key" in str(ei.value)
+
+def test_allow_dup_keeps_last_value_in_nested_object():
+    assert jp.parse('{"x":{"b":1,"b":2}}', allow_dup=True, fast=False) == {"x": {"b": 2}}
+
+@pytest.mark.parametrize("txt, expected", [
+    ('[1}', "unexpected token BRACE '}' at offset 2 - expected COMMA ','"),
+    ('{"a":1]', "unexpected token BRACKET ']' at offset 6 - expected COMMA ','"),
+])
+def test_mismatched_closer_reports_expected_comma(txt, expected):
+    with pytest.raises(SyntaxError) as ei:
+        jp.parse(txt, fast=False)
+    assert str(ei.value) == expected